@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class ClasscreationSchedulesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'classCreation_Schedules'
+
+    def ready(self):
+        from embeddings_simmilarities.index import connect_index_signals
+        connect_index_signals('classCreation_Schedules.Class')
@@ -1,22 +1,26 @@
 from django.core.management.base import BaseCommand
 from classCreation_Schedules.models import Class
-from embeddings_simmilarities.utils import generate_embedding
+from embeddings_simmilarities.utils import generate_embeddings
 
 
 class Command(BaseCommand):
     help = 'Update embeddings for all existing teachers'
 
     def handle(self, *args, **kwargs):
-        classes = Class.objects.all()
+        classes = list(Class.objects.all())
 
-        for class_ in classes:
-            combined_text = (
+        combined_texts = [
+            (
                 f"Class Name: {class_.className}. "
                 f"Description: {class_.description}. "
             )
+            for class_ in classes
+        ]
 
-            embedding = generate_embedding(combined_text)
-            class_.set_embedding(embedding)
+        embeddings = generate_embeddings(combined_texts)
+
+        for class_, embedding in zip(classes, embeddings):
+            class_.set_embedding(embedding.tolist())
             class_.save()
 
         self.stdout.write(self.style.SUCCESS('Embeddings have been updated successfully.'))
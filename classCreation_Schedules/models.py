@@ -1,6 +1,7 @@
 from django.db import models
-import pickle
-from embeddings_simmilarities.utils import generate_embedding, save_embedding_to_binary
+from embeddings_simmilarities.utils import (
+    generate_embedding, save_embedding_to_binary, load_embedding_from_binary, is_legacy_embedding_binary
+)
 
 
 # Create your models here.
@@ -18,7 +19,12 @@ class Class(models.Model):
         self.embedding = save_embedding_to_binary(emb_vector)
 
     def get_embedding(self):
-        return pickle.loads(self.embedding)
+        embedding = load_embedding_from_binary(self.embedding)
+        if is_legacy_embedding_binary(self.embedding):
+            # Migración perezosa de blobs pickle al formato float32
+            self.set_embedding(embedding)
+            type(self).objects.filter(pk=self.pk).update(embedding=self.embedding)
+        return embedding
 
     def save(self, *args, **kwargs):
         combined_text = (
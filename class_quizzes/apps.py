@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class ClassQuizzesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'class_quizzes'
+
+    def ready(self):
+        from . import signals  # noqa: F401
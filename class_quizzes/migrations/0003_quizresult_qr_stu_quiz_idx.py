@@ -0,0 +1,18 @@
+# Generated by Django 5.1 on 2026-10-15 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('class_quizzes', '0002_initial'),
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='quizresult',
+            index=models.Index(fields=['student', 'quiz', '-id'], name='qr_stu_quiz_idx'),
+        ),
+    ]
@@ -31,3 +31,8 @@ class QuizResult(models.Model):
     total_questions = models.IntegerField()  # Número total de preguntas
     correct_answers = models.IntegerField()  # Número de respuestas correctas
     completed_at = models.DateTimeField(auto_now_add=True)  # Fecha en que el estudiante completó el quiz
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['student', 'quiz', '-id'], name='qr_stu_quiz_idx'),
+        ]
@@ -5,7 +5,7 @@ Este módulo define las abstracciones que seguirán las implementaciones concret
 cumpliendo con el Principio de Inversión de Dependencias (DIP).
 """
 
-from typing import Protocol, List, Optional, Dict, Any
+from typing import Protocol, List, Optional, Dict, Any, Sequence, Tuple
 from django.http import HttpRequest
 
 
@@ -16,7 +16,12 @@ class QuizRepositoryInterface(Protocol):
         """Obtiene un quiz por su ID."""
         ...
     
-    def get_questions_by_quiz(self, quiz_id: int) -> List[Any]:
+    def get_quiz_with_questions_and_answers(self, quiz_id: int) -> Any:
+        """Obtiene un quiz con sus preguntas y respuestas precargadas."""
+        ...
+    
+    def get_questions_by_quiz(self, quiz_id: int,
+                              only: Sequence[str] = ('id', 'text')) -> List[Any]:
         """Obtiene todas las preguntas de un quiz."""
         ...
     
@@ -57,6 +62,15 @@ class QuizResultServiceInterface(Protocol):
         """Guarda el resultado de un quiz."""
         ...
     
+    def save_quiz_results_bulk(self, results: List[Dict[str, Any]],
+                               batch_size: int = 1000) -> List[Any]:
+        """Guarda varios resultados de quizzes en una sola transacción."""
+        ...
+    
+    def save_quiz_results_sql(self, rows: Sequence[Tuple[int, int, int, int, int]]) -> int:
+        """Inserta resultados de quizzes con SQL directo, sin pasar por el ORM."""
+        ...
+    
     def get_student_quiz_result(self, student_id: int, quiz_id: int) -> Optional[Any]:
         """Obtiene el resultado de un estudiante en un quiz específico."""
         ...
@@ -5,11 +5,33 @@ Esta clase maneja toda la lógica de negocio relacionada con la evaluación
 de quizzes, cálculo de puntajes y progreso.
 """
 
-from django.shortcuts import get_object_or_404
+from django.conf import settings
+from django.core.cache import cache
+from django.http import Http404
 from ..models import Answer
 from .interfaces import QuizEvaluationServiceInterface
 
 
+ANSWER_CACHE_TIMEOUT = 60 * 60
+
+# Backends cuya caché no se comparte entre procesos: una invalidación en un
+# worker no llegaría a los demás, así que con ellos no se cachea
+LOCAL_CACHE_BACKENDS = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+
+def answer_cache_enabled() -> bool:
+    """Indica si la caché por defecto es compartida y puede guardar respuestas."""
+    return settings.CACHES['default']['BACKEND'] not in LOCAL_CACHE_BACKENDS
+
+
+def answer_cache_key(answer_id: int) -> str:
+    """Llave de caché donde se guarda si una respuesta es correcta."""
+    return f'quiz_answer_is_correct:{answer_id}'
+
+
 class QuizEvaluationService(QuizEvaluationServiceInterface):
     """Implementación del servicio de evaluación de quizzes."""
     
@@ -17,14 +39,29 @@ class QuizEvaluationService(QuizEvaluationServiceInterface):
         """
         Evalúa si una respuesta es correcta.
         
+        Con una caché compartida (Redis) el resultado se guarda en caché y las
+        señales de Answer invalidan la entrada cuando la respuesta cambia o se
+        elimina. Con una caché local a cada proceso se consulta siempre la base
+        de datos.
+        
         Args:
             answer_id: ID de la respuesta seleccionada
             
         Returns:
             bool: True si la respuesta es correcta, False en caso contrario
         """
-        answer = get_object_or_404(Answer, id=answer_id)
-        return answer.is_correct
+        def load_is_correct():
+            try:
+                return Answer.objects.values_list('is_correct', flat=True).get(id=answer_id)
+            except Answer.DoesNotExist:
+                raise Http404("No Answer matches the given query.")
+        
+        if not answer_cache_enabled():
+            return load_is_correct()
+        
+        return cache.get_or_set(
+            answer_cache_key(answer_id), load_is_correct, timeout=ANSWER_CACHE_TIMEOUT
+        )
     
     def calculate_score(self, correct_answers: int, total_questions: int) -> int:
         """
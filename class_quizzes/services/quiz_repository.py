@@ -5,7 +5,8 @@ Esta clase implementa QuizRepositoryInterface y maneja todas las operaciones
 de acceso a datos relacionadas con quizzes, preguntas y respuestas.
 """
 
-from typing import List, Any
+from typing import List, Any, Sequence
+from django.db.models import Prefetch
 from django.shortcuts import get_object_or_404
 from ..models import Quiz, Question, Answer
 from .interfaces import QuizRepositoryInterface
@@ -18,9 +19,35 @@ class QuizRepository(QuizRepositoryInterface):
         """Obtiene un quiz por su ID."""
         return get_object_or_404(Quiz, id=quiz_id)
     
-    def get_questions_by_quiz(self, quiz_id: int) -> List[Question]:
-        """Obtiene todas las preguntas de un quiz."""
-        return list(Question.objects.filter(quiz_id=quiz_id))
+    def get_quiz_with_questions_and_answers(self, quiz_id: int) -> Quiz:
+        """
+        Obtiene un quiz con sus preguntas y respuestas precargadas.
+        
+        Resuelve quiz, preguntas y respuestas en tres consultas fijas, sin
+        importar cuántas preguntas tenga el quiz (evita el problema N+1).
+        """
+        queryset = Quiz.objects.prefetch_related(
+            Prefetch(
+                'question_set',
+                queryset=Question.objects.prefetch_related('answers')
+            )
+        )
+        return get_object_or_404(queryset, id=quiz_id)
+    
+    def get_questions_by_quiz(self, quiz_id: int,
+                              only: Sequence[str] = ('id', 'text')) -> List[Question]:
+        """
+        Obtiene todas las preguntas de un quiz con sus respuestas precargadas.
+        
+        Solo se cargan las columnas indicadas en `only`. Quien necesite el FK
+        `quiz` debe pedirlo explícitamente (por ejemplo `only=('id', 'text', 'quiz')`)
+        para no disparar una consulta por pregunta al accederlo.
+        """
+        return list(
+            Question.objects.filter(quiz_id=quiz_id)
+            .only(*only)
+            .prefetch_related('answers')
+        )
     
     def get_answers_by_question(self, question_id: int) -> List[Answer]:
         """Obtiene todas las respuestas de una pregunta."""
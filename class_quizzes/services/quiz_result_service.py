@@ -5,8 +5,11 @@ Esta clase maneja la persistencia y recuperación de resultados de quizzes
 de los estudiantes.
 """
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from django.db import connection, transaction
+from django.http import Http404
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
 from ..models import QuizResult, Quiz
 from users.models import Student
 from .interfaces import QuizResultServiceInterface
@@ -41,6 +44,80 @@ class QuizResultService(QuizResultServiceInterface):
             correct_answers=correct_answers
         )
     
+    def save_quiz_results_bulk(self, results: List[Dict[str, Any]],
+                               batch_size: int = 1000) -> List[QuizResult]:
+        """
+        Guarda varios resultados de quizzes en una sola transacción.
+        
+        Estudiantes y quizzes se cargan con una consulta cada uno y los
+        resultados se insertan por lotes con bulk_create.
+        
+        Args:
+            results: Lista de diccionarios con las llaves student_id, quiz_id,
+                score, total_questions y correct_answers
+            batch_size: Número máximo de filas por INSERT
+            
+        Returns:
+            List[QuizResult]: Los resultados guardados
+        """
+        if not results:
+            return []
+        
+        students = Student.objects.in_bulk({r['student_id'] for r in results})
+        quizzes = Quiz.objects.in_bulk({r['quiz_id'] for r in results})
+        
+        missing_students = {r['student_id'] for r in results} - students.keys()
+        missing_quizzes = {r['quiz_id'] for r in results} - quizzes.keys()
+        if missing_students or missing_quizzes:
+            raise Http404("Estudiante o quiz no encontrado.")
+        
+        objs = [
+            QuizResult(
+                student=students[r['student_id']],
+                quiz=quizzes[r['quiz_id']],
+                score=r['score'],
+                total_questions=r['total_questions'],
+                correct_answers=r['correct_answers']
+            )
+            for r in results
+        ]
+        
+        with transaction.atomic():
+            return QuizResult.objects.bulk_create(objs, batch_size=batch_size)
+    
+    def save_quiz_results_sql(self, rows: Sequence[Tuple[int, int, int, int, int]]) -> int:
+        """
+        Inserta resultados de quizzes con SQL directo, sin pasar por el ORM.
+        
+        Pensado para cargas muy grandes donde el costo de construir instancias
+        de QuizResult domina. No valida que existan los estudiantes o quizzes;
+        eso queda a cargo de las llaves foráneas de la base de datos.
+        
+        Args:
+            rows: Tuplas (student_id, quiz_id, score, total_questions, correct_answers)
+            
+        Returns:
+            int: Número de filas insertadas
+        """
+        if not rows:
+            return 0
+        
+        # Adaptar como lo haría el ORM (en SQLite, UTC sin zona horaria) para
+        # que estas filas ordenen y filtren igual que las creadas con save()
+        completed_at = connection.ops.adapt_datetimefield_value(timezone.now())
+        table = connection.ops.quote_name(QuizResult._meta.db_table)
+        sql = (
+            f"INSERT INTO {table} "
+            "(student_id, quiz_id, score, total_questions, correct_answers, completed_at) "
+            "VALUES (%s, %s, %s, %s, %s, %s)"
+        )
+        params = [(*row, completed_at) for row in rows]
+        
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.executemany(sql, params)
+        return len(params)
+    
     def get_student_quiz_result(self, student_id: int, quiz_id: int) -> Optional[QuizResult]:
         """
         Obtiene el resultado de un estudiante en un quiz específico.
@@ -52,10 +129,12 @@ class QuizResultService(QuizResultServiceInterface):
         Returns:
             QuizResult o None: El último resultado del estudiante en el quiz
         """
-        student = get_object_or_404(Student, id=student_id)
-        quiz = get_object_or_404(Quiz, id=quiz_id)
-        
-        return QuizResult.objects.filter(student=student, quiz=quiz).last()
+        return (
+            QuizResult.objects
+            .filter(student_id=student_id, quiz_id=quiz_id)
+            .order_by('-id')
+            .first()
+        )
     
     def get_student_completed_quizzes(self, student_id: int) -> List[QuizResult]:
         """
@@ -67,5 +146,8 @@ class QuizResultService(QuizResultServiceInterface):
         Returns:
             List[QuizResult]: Lista de resultados de quizzes completados
         """
-        student = get_object_or_404(Student, id=student_id)
-        return list(QuizResult.objects.filter(student=student))
+        return list(
+            QuizResult.objects
+            .filter(student_id=student_id)
+            .select_related('quiz__class_obj')
+        )
@@ -20,8 +20,8 @@ class SessionManager(SessionManagerInterface):
         Args:
             request: HttpRequest object
         """
-        if self.CORRECT_ANSWERS_KEY not in request.session:
-            request.session[self.CORRECT_ANSWERS_KEY] = 0
+        # setdefault solo marca la sesión como modificada si la llave no existía
+        request.session.setdefault(self.CORRECT_ANSWERS_KEY, 0)
     
     def update_correct_answers(self, request: HttpRequest, increment: int = 1) -> None:
         """
@@ -31,8 +31,9 @@ class SessionManager(SessionManagerInterface):
             request: HttpRequest object
             increment: Cantidad a incrementar (default: 1)
         """
-        self.initialize_quiz_session(request)
-        request.session[self.CORRECT_ANSWERS_KEY] += increment
+        request.session[self.CORRECT_ANSWERS_KEY] = (
+            request.session.get(self.CORRECT_ANSWERS_KEY, 0) + increment
+        )
     
     def get_correct_answers(self, request: HttpRequest) -> int:
         """
@@ -44,8 +45,7 @@ class SessionManager(SessionManagerInterface):
         Returns:
             int: Número de respuestas correctas
         """
-        self.initialize_quiz_session(request)
-        return request.session[self.CORRECT_ANSWERS_KEY]
+        return request.session.get(self.CORRECT_ANSWERS_KEY, 0)
     
     def clear_quiz_session(self, request: HttpRequest) -> None:
         """
@@ -22,7 +22,12 @@ class UserService(UserServiceInterface):
         Returns:
             Student: El estudiante asociado al usuario
         """
-        return get_object_or_404(Student, user=user)
+        # Se memoriza en el usuario para no repetir la consulta en la misma petición
+        student = getattr(user, '_student_cache', None)
+        if student is None:
+            student = get_object_or_404(Student.objects.select_related('user'), user=user)
+            user._student_cache = student
+        return student
     
     def get_teacher_by_user(self, user) -> Teacher:
         """
@@ -34,4 +39,8 @@ class UserService(UserServiceInterface):
         Returns:
             Teacher: El profesor asociado al usuario
         """
-        return get_object_or_404(Teacher, user=user)
+        teacher = getattr(user, '_teacher_cache', None)
+        if teacher is None:
+            teacher = get_object_or_404(Teacher.objects.select_related('user'), user=user)
+            user._teacher_cache = teacher
+        return teacher
@@ -0,0 +1,20 @@
+"""
+Señales del módulo class_quizzes.
+
+Mantienen sincronizada la caché usada por QuizEvaluationService cuando
+las respuestas se modifican o se eliminan.
+"""
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import Answer
+from .services.quiz_evaluation_service import answer_cache_key
+
+
+@receiver(post_save, sender=Answer)
+@receiver(post_delete, sender=Answer)
+def invalidate_answer_cache(sender, instance, **kwargs):
+    """Elimina de la caché el estado de la respuesta modificada."""
+    cache.delete(answer_cache_key(instance.pk))
@@ -84,7 +84,7 @@ def quiz_detail(request, quiz_id):
     # Inyección de dependencias
     quiz_repository = ServiceFactory.get_quiz_repository()
     
-    quiz = quiz_repository.get_quiz_by_id(quiz_id)
+    quiz = quiz_repository.get_quiz_with_questions_and_answers(quiz_id)
     return render(request, 'quiz_detail.html', {'quiz': quiz})
 
 
@@ -96,8 +96,8 @@ def take_quiz(request, quiz_id):
     session_manager = ServiceFactory.get_session_manager()
     user_service = ServiceFactory.get_user_service()
     
-    quiz = quiz_repository.get_quiz_by_id(quiz_id)
-    questions = quiz_repository.get_questions_by_quiz(quiz_id)
+    quiz = quiz_repository.get_quiz_with_questions_and_answers(quiz_id)
+    questions = list(quiz.question_set.all())
     total_questions = len(questions)
     student = user_service.get_student_by_user(request.user)
 
@@ -124,7 +124,7 @@ def take_quiz(request, quiz_id):
         return redirect('quiz_result', quiz_id=quiz.id)
 
     current_question = questions[current_question_index]
-    answers = quiz_repository.get_answers_by_question(current_question.id)
+    answers = list(current_question.answers.all())
 
     if request.method == 'POST':
         selected_answer_id = request.POST.get('answer')
@@ -0,0 +1,233 @@
+"""Top-k similarity search over stored model embeddings.
+
+Builds one index per model (Teacher, Class) over the memory-mapped matrix
+kept by the embeddings store. Each database gets its own store, and every
+build reconciles the stored ids with the rows that have an embedding, so
+rows added or removed behind the store's back are picked up. When FAISS is
+installed and the corpus is large enough, an HNSW graph answers queries
+sub-linearly; otherwise an exact matrix product over the normalized
+embeddings is used.
+
+Saving or deleting a row updates the store and drops the cached index;
+indexes are also rebuilt after INDEX_TTL_SECONDS so changes made by other
+processes are eventually picked up. The signal receivers are connected by
+the apps that own the indexed models (see connect_index_signals).
+"""
+import hashlib
+import threading
+import time
+
+import numpy as np
+from django.db import connections, router
+from django.db.models.signals import post_delete, post_save
+
+from .store import get_store
+from .utils import load_embedding_from_binary
+
+try:
+    import faiss
+except ImportError:  # FAISS is optional; fall back to exact search
+    faiss = None
+
+# Below this many vectors an exact scan is as fast as HNSW and exact
+FAISS_MIN_SIZE = 1000
+HNSW_NEIGHBORS = 32
+INDEX_TTL_SECONDS = 300
+# Ids per query when loading missing embeddings (SQLite parameter limit)
+LOAD_CHUNK_SIZE = 500
+
+
+def _normalize_rows(matrix):
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+class EmbeddingIndex:
+    """Cosine-similarity index over a fixed set of (id, embedding) pairs."""
+
+    def __init__(self, ids, vectors, normalized=False):
+        self.ids = np.asarray(ids)
+        vectors = np.asarray(vectors, dtype=np.float32)
+        # Store matrices are normalized on write; avoid copying them
+        self.vectors = vectors if normalized else _normalize_rows(vectors)
+        self.created_at = time.monotonic()
+        self._faiss_index = None
+        if faiss is not None and len(self.ids) >= FAISS_MIN_SIZE:
+            index = faiss.IndexHNSWFlat(
+                self.vectors.shape[1], HNSW_NEIGHBORS, faiss.METRIC_INNER_PRODUCT
+            )
+            index.add(np.ascontiguousarray(self.vectors))
+            self._faiss_index = index
+
+    def __len__(self):
+        return len(self.ids)
+
+    def search(self, query, k):
+        """Return up to k (id, similarity) pairs, most similar first."""
+        if len(self) == 0 or k <= 0:
+            return []
+        k = min(k, len(self))
+        query = _normalize_rows(np.asarray(query, dtype=np.float32)[None, :])
+
+        if self._faiss_index is not None:
+            scores, positions = self._faiss_index.search(query, k)
+            scores, positions = scores[0], positions[0]
+            keep = positions >= 0
+            scores, positions = scores[keep], positions[keep]
+        else:
+            all_scores = self.vectors @ query[0]
+            positions = np.argpartition(-all_scores, k - 1)[:k]
+            positions = positions[np.argsort(-all_scores[positions])]
+            scores = all_scores[positions]
+
+        return [(self.ids[pos].item(), float(score)) for pos, score in zip(positions, scores)]
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+_reset_stores = set()
+
+
+def _store_for(model):
+    """Return the store of model for the database it is read from.
+
+    The store name includes a digest of the database name, so test
+    databases and other deployments never share vectors by primary key.
+    In-memory databases (tests) start empty in every process, so their
+    store is cleared the first time the process uses it.
+    """
+    connection = connections[router.db_for_read(model)]
+    db_name = str(connection.settings_dict['NAME'])
+    digest = hashlib.sha1(db_name.encode()).hexdigest()[:12]
+    name = f'{model._meta.label_lower}-{digest}'
+    store = get_store(name)
+    is_in_memory = getattr(connection, 'is_in_memory_db', None)
+    if is_in_memory is not None and is_in_memory() and name not in _reset_stores:
+        _reset_stores.add(name)
+        store.clear()
+    return store
+
+
+def _with_embedding(model):
+    return model.objects.exclude(embedding__isnull=True).exclude(embedding=b'')
+
+
+def _load_from_database(model, ids=None):
+    """Return (ids, vectors) for the given ids, or for every embedded row."""
+    if ids is None:
+        rows = _with_embedding(model).values_list('id', 'embedding').iterator()
+    else:
+        ids = sorted(ids)
+        rows = (
+            row
+            for start in range(0, len(ids), LOAD_CHUNK_SIZE)
+            for row in _with_embedding(model).filter(
+                id__in=ids[start:start + LOAD_CHUNK_SIZE]
+            ).values_list('id', 'embedding')
+        )
+    loaded_ids, vectors = [], []
+    for pk, blob in rows:
+        loaded_ids.append(pk)
+        vectors.append(load_embedding_from_binary(blob))
+    return loaded_ids, vectors
+
+
+def _sync_store(model, store):
+    """Make the stored ids match the rows of model that have an embedding.
+
+    Rows that were deleted are dropped and rows that are missing are loaded;
+    vectors of rows already stored are kept up to date by the save signal.
+    """
+    db_ids = set(_with_embedding(model).values_list('id', flat=True))
+    stored_ids = store.ids()
+    stale = stored_ids - db_ids
+    if stale:
+        store.delete_many(stale)
+    missing = db_ids - stored_ids
+    if missing:
+        # An empty store is filled with a single query over the whole table
+        ids, vectors = _load_from_database(model, None if not stored_ids else missing)
+        store.save_many(ids, vectors)
+
+
+def _build_index(model):
+    store = _store_for(model)
+    try:
+        _sync_store(model, store)
+    except ValueError:
+        # Mixed dimensions cannot share one matrix; score from the database
+        store.clear()
+        ids, vectors = _load_from_database(model)
+        if not vectors:
+            return EmbeddingIndex([], np.empty((0, 0), dtype=np.float32))
+        return EmbeddingIndex(ids, np.stack(vectors))
+
+    ids, matrix = store.load_all()
+    return EmbeddingIndex(ids, matrix, normalized=True)
+
+
+def get_index(model):
+    """Return the cached index for model, rebuilding it if missing or stale."""
+    label = model._meta.label
+    with _indexes_lock:
+        index = _indexes.get(label)
+        if index is None or time.monotonic() - index.created_at > INDEX_TTL_SECONDS:
+            index = _build_index(model)
+            _indexes[label] = index
+        return index
+
+
+def invalidate_index(sender, **kwargs):
+    """Drop the cached index of the sender model."""
+    with _indexes_lock:
+        _indexes.pop(sender._meta.label, None)
+
+
+def _on_save(sender, instance, **kwargs):
+    if instance.embedding:
+        store = _store_for(sender)
+        try:
+            store.save(instance.pk, load_embedding_from_binary(instance.embedding))
+        except ValueError:
+            # Dimension changed; refill the store from the database next time
+            store.clear()
+    invalidate_index(sender)
+
+
+def _on_delete(sender, instance, **kwargs):
+    _store_for(sender).delete(instance.pk)
+    invalidate_index(sender)
+
+
+def connect_index_signals(model_label):
+    """Keep the store of model_label in sync with its saves and deletes.
+
+    Called from the AppConfig.ready() of the app that owns the model, so
+    every process (web workers, shell, management commands) writes through.
+    """
+    post_save.connect(_on_save, sender=model_label, dispatch_uid=f'emb_index_save_{model_label}')
+    post_delete.connect(_on_delete, sender=model_label, dispatch_uid=f'emb_index_delete_{model_label}')
+
+
+def most_similar(model, query, k, queryset=None):
+    """Return up to k (instance, similarity) pairs of model closest to query.
+
+    queryset lets callers add select_related/only for the returned instances.
+    Ids that are no longer in the queryset (deleted by another process, or
+    filtered out by the caller) are skipped and more candidates are fetched.
+    """
+    if queryset is None:
+        queryset = model.objects.all()
+    index = get_index(model)
+    fetch = k
+    while True:
+        matches = index.search(query, fetch)
+        objects = queryset.in_bulk([pk for pk, _ in matches])
+        results = [(objects[pk], score) for pk, score in matches if pk in objects]
+        if len(results) >= k or fetch >= len(index):
+            return results[:k]
+        fetch = min(fetch * 2, len(index))
+
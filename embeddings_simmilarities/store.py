@@ -0,0 +1,183 @@
+"""Columnar on-disk storage of embeddings for bulk similarity scoring.
+
+Each store keeps every vector of one model as a row of a raw float32 file
+that is memory-mapped as a single (N, dim) matrix, plus a small SQLite
+table mapping object ids to row numbers. Scoring the whole corpus is then
+one matrix-vector product over the mapped file instead of decoding one
+blob per row.
+
+Vectors are L2-normalized on write, so ``matrix @ query`` is already the
+cosine similarity for a normalized query.
+
+Writers are serialized across threads and, where ``fcntl`` is available,
+across processes with an exclusive lock on a sidecar ``.lock`` file, so
+every web worker can keep the store in sync with its own saves.
+"""
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows; only threads are serialized
+    fcntl = None
+
+EMBEDDINGS_STORE_DIR = os.getenv(
+    'EMBEDDINGS_STORE_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'store'),
+)
+
+_ITEM_SIZE = np.dtype(np.float32).itemsize
+
+
+def _normalize(vector):
+    vec = np.array(vector, dtype=np.float32).ravel()
+    norm = np.linalg.norm(vec)
+    if norm > 0:
+        vec /= norm
+    return vec
+
+
+class EmbeddingStore:
+    """Append-only float32 matrix file with an id -> row index."""
+
+    def __init__(self, name, directory=EMBEDDINGS_STORE_DIR):
+        os.makedirs(directory, exist_ok=True)
+        self.data_path = os.path.join(directory, f'{name}.f32')
+        self.lock_path = os.path.join(directory, f'{name}.lock')
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(os.path.join(directory, f'{name}.sqlite3'), check_same_thread=False)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS rows (id INTEGER PRIMARY KEY, row INTEGER NOT NULL)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+        self._conn.commit()
+
+    @contextmanager
+    def _writing(self):
+        """Hold the write lock of this store, shared by threads and processes."""
+        with self._lock, open(self.lock_path, 'a') as lock_file:
+            if fcntl is not None:
+                # Released when the file is closed
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            yield
+
+    def _dim(self):
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'dim'").fetchone()
+        return row[0] if row else None
+
+    def _row_count(self, dim):
+        if not dim or not os.path.exists(self.data_path):
+            return 0
+        return os.path.getsize(self.data_path) // (dim * _ITEM_SIZE)
+
+    def _existing_rows(self, ids):
+        existing = {}
+        ids = list(ids)
+        # Stay below SQLite's default limit of bound parameters per statement
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            existing.update(self._conn.execute(
+                f"SELECT id, row FROM rows WHERE id IN ({placeholders})", chunk
+            ).fetchall())
+        return existing
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM rows").fetchone()[0]
+
+    def ids(self):
+        """Return the set of stored ids."""
+        with self._lock:
+            return {pk for (pk,) in self._conn.execute("SELECT id FROM rows")}
+
+    def save_many(self, ids, vectors):
+        """Insert or overwrite the vectors of the given ids.
+
+        Raises ValueError if the vector dimension differs from the one
+        already stored; call clear() first to switch dimensions.
+        """
+        vectors = [_normalize(vector) for vector in vectors]
+        if not vectors:
+            return
+        with self._writing():
+            dim = self._dim()
+            if dim is None:
+                dim = len(vectors[0])
+                self._conn.execute("INSERT INTO meta (key, value) VALUES ('dim', ?)", (dim,))
+            if any(len(vec) != dim for vec in vectors):
+                raise ValueError(f"Embedding dimension does not match stored dimension {dim}")
+
+            existing = self._existing_rows(ids)
+
+            next_row = self._row_count(dim)
+            new_rows = []
+            mode = 'r+b' if os.path.exists(self.data_path) else 'w+b'
+            with open(self.data_path, mode) as data_file:
+                for pk, vec in zip(ids, vectors):
+                    row = existing.get(pk)
+                    if row is None:
+                        row = next_row
+                        next_row += 1
+                        existing[pk] = row
+                        new_rows.append((pk, row))
+                    data_file.seek(row * dim * _ITEM_SIZE)
+                    data_file.write(vec.tobytes())
+                data_file.flush()
+            self._conn.executemany("INSERT OR REPLACE INTO rows (id, row) VALUES (?, ?)", new_rows)
+            self._conn.commit()
+
+    def save(self, pk, vector):
+        self.save_many([pk], [vector])
+
+    def delete_many(self, ids):
+        """Forget the vectors of the given ids; their rows stay in the file unused."""
+        with self._writing():
+            self._conn.executemany("DELETE FROM rows WHERE id = ?", [(pk,) for pk in ids])
+            self._conn.commit()
+
+    def delete(self, pk):
+        self.delete_many([pk])
+
+    def clear(self):
+        with self._writing():
+            self._conn.execute("DELETE FROM rows")
+            self._conn.execute("DELETE FROM meta")
+            self._conn.commit()
+            if os.path.exists(self.data_path):
+                os.remove(self.data_path)
+
+    def load_all(self):
+        """Return (ids, matrix) with one normalized float32 row per stored id.
+
+        The matrix is the memory-mapped file itself when no rows were
+        deleted, and a compacted in-memory copy otherwise.
+        """
+        with self._lock:
+            dim = self._dim()
+            mapping = self._conn.execute("SELECT id, row FROM rows ORDER BY row").fetchall()
+            row_count = self._row_count(dim)
+        if not mapping or not row_count:
+            return np.empty(0, dtype=np.int64), np.empty((0, dim or 0), dtype=np.float32)
+
+        ids = np.fromiter((pk for pk, _ in mapping), dtype=np.int64, count=len(mapping))
+        rows = np.fromiter((row for _, row in mapping), dtype=np.int64, count=len(mapping))
+        matrix = np.memmap(self.data_path, dtype=np.float32, mode='r', shape=(row_count, dim))
+        if len(rows) == row_count:
+            return ids, matrix
+        return ids, matrix[rows]
+
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_store(name):
+    """Return the process-wide store with the given name."""
+    with _stores_lock:
+        store = _stores.get(name)
+        if store is None:
+            store = _stores[name] = EmbeddingStore(name)
+        return store
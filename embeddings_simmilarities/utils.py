@@ -4,7 +4,12 @@ import numpy as np
 from dotenv import load_dotenv, find_dotenv
 import google.generativeai as genai
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import sqlite3
+import threading
 import hashlib
+import zlib
 
 # Load project .env (falls back to any .env) and configure Gemini API key
 dotenv_path = find_dotenv('.env') or find_dotenv()
@@ -21,6 +26,29 @@ if not GEN_AI_KEY:
 # Configure the Google Generative AI client
 genai.configure(api_key=GEN_AI_KEY)
 
+# Shared HTTP session so TCP/TLS connections to Gemini are reused across calls.
+# Transient errors are retried; other statuses (e.g. 404) surface immediately.
+_http_session = requests.Session()
+_http_session.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=100,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset({'POST'}),
+        raise_on_status=False,
+    ),
+))
+
+# Persistent on-disk cache of remote embeddings, keyed by SHA-256(model + text)
+EMBEDDINGS_CACHE_PATH = os.getenv(
+    'EMBEDDINGS_CACHE_PATH',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'embeddings_cache.db'),
+)
+_cache_conn = None
+_cache_lock = threading.Lock()
+
 
 def _local_fallback_embedding(text: str, dim: int = 512):
     """Deterministic local fallback embedding.
@@ -30,78 +58,227 @@ def _local_fallback_embedding(text: str, dim: int = 512):
     Gemini embeddings but allows the app to continue operating when the remote
     embedding service is unavailable or configured incorrectly.
     """
-    vec = np.zeros(dim, dtype=float)
-    # Simple tokenization by whitespace
-    for i, token in enumerate(text.split()):
-        # Hash token to an integer and map into vector index
-        h = int(hashlib.md5(token.encode('utf-8')).hexdigest()[:8], 16)
-        idx = h % dim
-        vec[idx] += 1.0
+    tokens = text.split()
+    # Hash tokens with CRC32 (stable across processes, unlike hash()) and map
+    # every token to its vector index in one pass
+    idxs = np.fromiter(
+        (zlib.crc32(token.encode('utf-8')) for token in tokens),
+        dtype=np.uint32,
+        count=len(tokens),
+    ) % dim
+    vec = np.bincount(idxs, minlength=dim).astype(np.float32)
     # Normalize
     norm = np.linalg.norm(vec)
     if norm > 0:
-        vec = vec / norm
+        vec /= norm
     return vec.tolist()
 
 
-def generate_embedding(text: str):
-    """Generate an embedding for the given text using Gemini (Google Generative AI).
+EMBEDDING_MODEL = "text-embedding-gecko-001"
+EMBEDDING_BATCH_SIZE = 100
+
+
+def _batches(texts, size=EMBEDDING_BATCH_SIZE):
+    for start in range(0, len(texts), size):
+        yield texts[start:start + size]
+
+
+def _local_fallback_embeddings(texts):
+    return np.asarray([_local_fallback_embedding(text) for text in texts], dtype=np.float32)
+
+
+def _request_embeddings(texts, model):
+    """Embed one batch of texts through the Gemini REST endpoint."""
+    url = f"https://generativelanguage.googleapis.com/v1/models/{model}:embed?key={GEN_AI_KEY}"
+    payload = {"input": texts}
+    headers = {"Content-Type": "application/json"}
+    r = _http_session.post(url, json=payload, headers=headers, timeout=15)
+    r.raise_for_status()
+    data = r.json()
+    if 'data' in data and isinstance(data['data'], list) and len(data['data']) == len(texts):
+        return [item['embedding'] for item in data['data']]
+    if 'embedding' in data and len(texts) == 1:
+        return [data['embedding']]
+    raise RuntimeError(f"Unexpected embedding response shape: {data}")
+
+
+def _get_cache_connection():
+    """Open (once) the SQLite connection backing the embeddings cache."""
+    global _cache_conn
+    if _cache_conn is None:
+        conn = sqlite3.connect(EMBEDDINGS_CACHE_PATH, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS emb (key TEXT PRIMARY KEY, vec BLOB NOT NULL)")
+        conn.commit()
+        _cache_conn = conn
+    return _cache_conn
+
 
-    Tries SDK helper, falls back to REST; if REST returns 404 or another error,
-    falls back to a deterministic local embedding so the application can continue.
+def _cache_key(text, model):
+    return hashlib.sha256(f"{model}\0{text}".encode('utf-8')).hexdigest()
+
+
+def _cache_get_many(keys):
+    """Return a {key: float32 vector} dict with the cached entries for keys."""
+    found = {}
+    with _cache_lock:
+        conn = _get_cache_connection()
+        unique_keys = list(dict.fromkeys(keys))
+        # Stay below SQLite's default limit of bound parameters per statement
+        for start in range(0, len(unique_keys), 500):
+            chunk = unique_keys[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT key, vec FROM emb WHERE key IN ({placeholders})", chunk
+            ).fetchall()
+            for key, blob in rows:
+                found[key] = np.frombuffer(blob, dtype=np.float32)
+    return found
+
+
+def _cache_put_many(items):
+    """Store (key, vector) pairs in the cache as packed float32 bytes."""
+    with _cache_lock:
+        conn = _get_cache_connection()
+        conn.executemany(
+            "INSERT OR IGNORE INTO emb (key, vec) VALUES (?, ?)",
+            [(key, np.asarray(vec, dtype=np.float32).tobytes()) for key, vec in items],
+        )
+        conn.commit()
+
+
+def _fetch_embeddings(texts, model):
+    """Embed texts remotely; returns None when Gemini could not be used.
+
+    Tries SDK helper, falls back to REST; errors are logged and reported as
+    None so the caller can fall back to local embeddings.
     """
-    model = "text-embedding-gecko-001"
     try:
         if hasattr(genai, 'embeddings'):
-            response = genai.embeddings.create(
-                model=model,
-                input=text,
-            )
-            embedding = response.data[0].embedding
-            return embedding
+            rows = []
+            for batch in _batches(texts):
+                response = genai.embeddings.create(
+                    model=model,
+                    input=batch,
+                )
+                rows.extend(item.embedding for item in response.data)
+            return np.asarray(rows, dtype=np.float32)
         else:
             raise AttributeError("genai.embeddings not available")
     except AttributeError:
         # Fallback to HTTP call
         try:
-            api_key = GEN_AI_KEY
-            url = f"https://generativelanguage.googleapis.com/v1/models/{model}:embed?key={api_key}"
-            payload = {"input": text}
-            headers = {"Content-Type": "application/json"}
-            r = requests.post(url, json=payload, headers=headers, timeout=15)
-            r.raise_for_status()
-            data = r.json()
-            if 'data' in data and isinstance(data['data'], list) and 'embedding' in data['data'][0]:
-                return data['data'][0]['embedding']
-            if 'embedding' in data:
-                return data['embedding']
-            raise RuntimeError(f"Unexpected embedding response shape: {data}")
+            rows = []
+            for batch in _batches(texts):
+                rows.extend(_request_embeddings(batch, model))
+            return np.asarray(rows, dtype=np.float32)
         except requests.HTTPError as http_err:
             status = http_err.response.status_code if http_err.response is not None else None
             # If model not found (404) or access problems, fallback locally and log
             print(f"HTTP error calling Gemini embeddings (status={status}): {http_err}")
             print("Falling back to local deterministic embedding. Check model name and API key or SDK version.")
-            return _local_fallback_embedding(text)
+            return None
         except Exception as e:
             print(f"Error generating embedding with Gemini (HTTP fallback): {e}")
             print("Falling back to local deterministic embedding.")
-            return _local_fallback_embedding(text)
+            return None
     except Exception as e:
         print(f"Error generating embedding with Gemini SDK: {e}")
         print("Falling back to local deterministic embedding.")
-        return _local_fallback_embedding(text)
+        return None
+
+
+def generate_embeddings(texts, model=EMBEDDING_MODEL):
+    """Generate embeddings for many texts using Gemini (Google Generative AI).
+
+    Texts already embedded with the same model are read from the on-disk
+    cache; the rest are sent in batches of up to EMBEDDING_BATCH_SIZE per
+    request, so N texts cost one round-trip per batch instead of one per text.
+    Returns a (len(texts), dim) float32 array.
+
+    If Gemini cannot be reached, falls back to deterministic local embeddings
+    for the whole input so every row has the same dimension. Local fallback
+    vectors are never cached.
+    """
+    texts = list(texts)
+    if not texts:
+        return np.empty((0, 0), dtype=np.float32)
+
+    keys = [_cache_key(text, model) for text in texts]
+    cached = _cache_get_many(keys)
+
+    missing = {}
+    for key, text in zip(keys, texts):
+        if key not in cached:
+            missing.setdefault(key, text)
+
+    if missing:
+        fetched = _fetch_embeddings(list(missing.values()), model)
+        if fetched is None:
+            return _local_fallback_embeddings(texts)
+        new_items = list(zip(missing.keys(), fetched))
+        _cache_put_many(new_items)
+        cached.update(new_items)
+
+    return np.stack([cached[key] for key in keys])
+
+
+def generate_embedding(text: str):
+    """Generate an embedding for the given text using Gemini (Google Generative AI).
+
+    Thin wrapper over generate_embeddings for a single text; returns a list.
+    """
+    return generate_embeddings([text])[0].tolist()
+
+
+# Version prefix of the packed float32 format written by save_embedding_to_binary
+EMBEDDING_FORMAT_V1 = b'\x01'
 
 
 def save_embedding_to_binary(embedding):
-    return pickle.dumps(embedding)
+    """Pack an embedding as a version byte followed by raw float32 values.
+
+    Vectors are L2-normalized before packing; cosine similarity does not
+    depend on magnitude, so this only makes query-time scoring cheaper.
+    """
+    vec = np.array(embedding, dtype=np.float32)
+    norm = np.linalg.norm(vec)
+    if norm > 0:
+        vec /= norm
+    return EMBEDDING_FORMAT_V1 + vec.tobytes()
+
+
+def is_legacy_embedding_binary(binary_embedding):
+    """True for blobs written with pickle before the packed float32 format."""
+    return bytes(binary_embedding[:1]) != EMBEDDING_FORMAT_V1
 
 
 def load_embedding_from_binary(binary_embedding):
-    return pickle.loads(binary_embedding)
+    """Unpack an embedding blob into a float32 array.
+
+    Blobs stored before the packed format are still read through pickle;
+    callers should re-save them with save_embedding_to_binary.
+    """
+    if is_legacy_embedding_binary(binary_embedding):
+        return np.asarray(pickle.loads(binary_embedding), dtype=np.float32)
+    return np.frombuffer(binary_embedding, dtype=np.float32, offset=1)
+
+
+def calcular_similitudes(embedding_aspirante, embeddings_empleos):
+    """Cosine similarity of one embedding against every row of a (N, dim) matrix.
+
+    Runs as a single matrix-vector product instead of a Python loop of
+    calcular_similitud calls. Returns a length-N array.
+    """
+    empleos = np.asarray(embeddings_empleos, dtype=np.float32)
+    if empleos.shape[0] == 0:
+        return np.empty(0, dtype=np.float32)
+    aspirante = np.asarray(embedding_aspirante, dtype=np.float32)
+    norms = np.linalg.norm(empleos, axis=1) * np.linalg.norm(aspirante)
+    norms[norms == 0] = np.inf
+    return (empleos @ aspirante) / norms
 
 
 def calcular_similitud(embedding_aspirante, embedding_empleo):
-    dot_product = np.dot(embedding_aspirante, embedding_empleo)
-    norm_aspirante = np.linalg.norm(embedding_aspirante)
-    norm_empleo = np.linalg.norm(embedding_empleo)
-    return dot_product / (norm_aspirante * norm_empleo)
+    empleo = np.asarray(embedding_empleo, dtype=np.float32)
+    return calcular_similitudes(embedding_aspirante, empleo[None, :])[0]
@@ -1,8 +1,12 @@
+import logging
+
 from django.db import models
+from django.db.models import Avg
 from users.models import Teacher, Student
-from django.core.mail import send_mail
-from django.conf import settings
 from django.utils import timezone
+from .tasks import enqueue_rating_notification
+
+logger = logging.getLogger(__name__)
 
 
 class RatingObserver:
@@ -16,78 +20,57 @@ class RatingObserver:
     En este caso, cuando se crea una calificación (Subject), múltiples observadores
     son notificados para realizar acciones específicas.
     """
+    # Si es False, el observador no se notifica cuando una actualización
+    # no cambia el valor de la calificación
+    notify_on_unchanged_rating = True
+    
     def update(self, rating):
         """Método que debe implementar cada observador concreto"""
         raise NotImplementedError("Los observadores deben implementar el método update()")
+    
+    def __call__(self, sender, instance, raw=False, **kwargs):
+        """Receptor de post_save: notifica al observador la calificación guardada"""
+        # Las cargas de fixtures (raw) no disparan el patrón Observer
+        if raw:
+            return
+        if not self.notify_on_unchanged_rating and not instance.rating_changed():
+            return
+        try:
+            self.update(instance)
+        except Exception:
+            logger.exception("Error en observer %s", self.__class__.__name__)
 
 
 class EmailNotificationObserver(RatingObserver):
     """Observer concreto que envía notificaciones por email al profesor"""
     
     def update(self, rating):
-        """Envía email al profesor notificando la nueva calificación"""
-        print(f"🔔 Observer EMAIL activado para rating ID {rating.id}")
-        print(f"📧 Intentando enviar email a: {rating.teacher.user.email}")
-        
-        try:
-            subject = f"Nueva calificación recibida - {rating.rating}/5 estrellas"
-            message = f"""
-            Hola {rating.teacher.user.name},
-            
-            Has recibido una nueva calificación:
-            
-            Estudiante: {rating.student.user.name}
-            Calificación: {rating.rating}/5 estrellas
-            Comentario: {rating.comment or 'Sin comentario'}
-            Fecha: {rating.created_at.strftime('%d/%m/%Y %H:%M')}
-            
-            ¡Sigue brindando excelente educación!
-            
-            Saludos,
-            El equipo de NexClass
-            """
-            
-            print(f"📝 Preparando email:")
-            print(f"   Asunto: {subject}")
-            print(f"   Para: {rating.teacher.user.email}")
-            print(f"   Desde: {settings.DEFAULT_FROM_EMAIL}")
-            
-            result = send_mail(
-                subject=subject,
-                message=message,
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=[rating.teacher.user.email],
-                fail_silently=False
-            )
-            
-            if result == 1:
-                print(f"✅ Email enviado exitosamente a {rating.teacher.user.email}")
-            else:
-                print(f"⚠️ Email no pudo ser enviado. Resultado: {result}")
-                
-        except Exception as e:
-            print(f"❌ Error enviando email: {e}")
-            print(f"❌ Tipo de error: {type(e).__name__}")
-            import traceback
-            print(f"❌ Traceback: {traceback.format_exc()}")
+        """Encola el email al profesor notificando la nueva calificación"""
+        logger.debug("Observer EMAIL activado para rating ID %s", rating.id)
+        # El envío SMTP se hace fuera del hilo de la petición
+        enqueue_rating_notification(rating.id)
 
 
 class StatisticsUpdateObserver(RatingObserver):
     """Observer concreto que actualiza estadísticas del profesor"""
     
+    notify_on_unchanged_rating = False
+    
     def update(self, rating):
         """Actualiza el promedio de calificaciones del profesor"""
-        print(f"📊 Observer ESTADÍSTICAS activado para rating ID {rating.id}")
+        logger.debug("Observer ESTADÍSTICAS activado para rating ID %s", rating.id)
         try:
             teacher = rating.teacher
-            all_ratings = teacher.ratings.all()
-            if all_ratings:
-                average = sum(r.rating for r in all_ratings) / all_ratings.count()
+            # El promedio se calcula en la base de datos con un solo AVG
+            average = teacher.ratings.aggregate(avg=Avg('rating'))['avg']
+            if average is not None:
+                # Teacher.average_rating no es una columna (lo oculta el método
+                # del mismo nombre), así que basta con actualizar la instancia
                 teacher.average_rating = round(average, 2)
-                teacher.save()
-                print(f"✅ Estadísticas actualizadas para {teacher.user.name}: {average:.2f}")
-        except Exception as e:
-            print(f"❌ Error actualizando estadísticas: {e}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Estadísticas actualizadas para %s: %.2f", teacher.user.name, average)
+        except Exception:
+            logger.exception("Error actualizando estadísticas")
 
 
 class ActivityLogObserver(RatingObserver):
@@ -95,86 +78,54 @@ class ActivityLogObserver(RatingObserver):
     
     def update(self, rating):
         """Registra la nueva calificación en el log de actividad"""
-        print(f"📝 Observer LOG activado para rating ID {rating.id}")
+        logger.debug("Observer LOG activado para rating ID %s", rating.id)
+        if not logger.isEnabledFor(logging.INFO):
+            # Evita las consultas de usuario si el log de actividad está apagado
+            return
         try:
-            log_message = (
-                f"[{timezone.now()}] Nueva calificación: "
-                f"{rating.student.user.username} calificó a "
-                f"{rating.teacher.user.username} con {rating.rating}/5"
+            logger.info(
+                "[%s] Nueva calificación: %s calificó a %s con %s/5",
+                timezone.now(),
+                rating.student.user.username,
+                rating.teacher.user.username,
+                rating.rating,
             )
-            print(f"📝 LOG: {log_message}")
-            
-            # Aquí podrías escribir a un archivo de log o base de datos
-            # Por ahora solo imprimimos en consola para demostración
-        except Exception as e:
-            print(f"❌ Error en log: {e}")
+        except Exception:
+            logger.exception("Error en log")
 
 
 class TeacherRating(models.Model):
     """
     Modelo Subject del patrón Observer.
     
-    Mantiene una lista de observadores y los notifica cuando se crea una nueva calificación.
+    Los observadores están conectados a la señal post_save del modelo
+    (ver reviews/signals.py) y se notifican cada vez que se guarda una calificación.
     """
     teacher = models.ForeignKey(Teacher, on_delete=models.CASCADE, related_name='ratings')
     student = models.ForeignKey(Student, on_delete=models.CASCADE)
     rating = models.PositiveIntegerField()
     comment = models.TextField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
-
-    # Lista de observadores (patrón Observer)
-    _observers = []
     
     class Meta:
         unique_together = ('teacher', 'student')  # Un estudiante solo puede calificar a un profesor una vez
     
     @classmethod
-    def add_observer(cls, observer):
-        """Agrega un observador a la lista de notificación"""
-        if observer not in cls._observers:
-            cls._observers.append(observer)
-            print(f"👁️ Observer agregado: {observer.__class__.__name__}")
-    
-    @classmethod
-    def remove_observer(cls, observer):
-        """Remueve un observador de la lista"""
-        if observer in cls._observers:
-            cls._observers.remove(observer)
-            print(f"🚫 Observer removido: {observer.__class__.__name__}")
+    def from_db(cls, db, field_names, values):
+        """Guarda la calificación cargada para detectar si cambia al guardar"""
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_rating = instance.__dict__.get('rating')
+        return instance
     
-    def notify_observers(self):
-        """Notifica a todos los observadores sobre la nueva calificación"""
-        print(f"📢 Notificando a {len(self._observers)} observadores...")
-        for observer in self._observers:
-            try:
-                observer.update(self)
-            except Exception as e:
-                print(f"❌ Error en observer {observer.__class__.__name__}: {e}")
+    def rating_changed(self):
+        """Indica si la calificación es nueva o su valor cambió desde que se cargó"""
+        loaded_rating = getattr(self, '_loaded_rating', None)
+        return loaded_rating is None or loaded_rating != self.rating
     
     def save(self, *args, **kwargs):
-        """Override del método save para implementar el patrón Observer"""
-        # Verificar si es una nueva calificación
-        is_new = self.pk is None
-        print(f"💾 TeacherRating.save() llamado - is_new: {is_new}, PK: {self.pk}")
-        
-        # Llamar al método save original
+        """Guarda la calificación; post_save notifica a los observadores"""
         super().save(*args, **kwargs)
-        print(f"💾 Después de super().save() - PK: {self.pk}")
-        
-        # Ejecutar observers tanto para nuevas calificaciones como para actualizaciones
-        if is_new:
-            print(f"🚀 Ejecutando notify_observers() porque es una NUEVA calificación")
-            self.notify_observers()
-        else:
-            print(f"🔄 Ejecutando notify_observers() porque es una ACTUALIZACIÓN de calificación")
-            self.notify_observers()
+        self._loaded_rating = self.rating
     
     def __str__(self):
         return f"{self.student.user.username} -> {self.teacher.user.username}: {self.rating}/5"
-
-
-# Auto-registro de observadores cuando se importa el módulo
-# Esto demuestra el patrón Observer en acción
-TeacherRating.add_observer(EmailNotificationObserver())
-TeacherRating.add_observer(StatisticsUpdateObserver())
-TeacherRating.add_observer(ActivityLogObserver())
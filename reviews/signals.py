@@ -0,0 +1,61 @@
+"""
+Señales del módulo reviews.
+
+Conecta los observadores de TeacherRating (patrón Observer) a post_save una
+sola vez, al cargar la aplicación. Los flujos masivos pueden desconectarlos
+temporalmente con rating_observers_disabled().
+"""
+
+from contextlib import contextmanager
+
+from django.db.models.signals import post_save
+
+from .models import (
+    ActivityLogObserver,
+    EmailNotificationObserver,
+    StatisticsUpdateObserver,
+    TeacherRating,
+)
+
+# Observadores registrados, en el orden en que se notifican
+RATING_OBSERVERS = (
+    EmailNotificationObserver(),
+    StatisticsUpdateObserver(),
+    ActivityLogObserver(),
+)
+
+
+def _dispatch_uid(observer):
+    return f'teacher_rating_{observer.__class__.__name__}'
+
+
+def connect_rating_observers():
+    """Conecta cada observador a post_save de TeacherRating (idempotente)"""
+    for observer in RATING_OBSERVERS:
+        post_save.connect(observer, sender=TeacherRating, weak=False, dispatch_uid=_dispatch_uid(observer))
+
+
+def disconnect_rating_observers():
+    """Desconecta todos los observadores de post_save de TeacherRating"""
+    for observer in RATING_OBSERVERS:
+        post_save.disconnect(sender=TeacherRating, dispatch_uid=_dispatch_uid(observer))
+
+
+@contextmanager
+def rating_observers_disabled():
+    """
+    Desactiva los observadores mientras dura el bloque.
+    
+    Pensado para importaciones que guardan muchas calificaciones con save();
+    bulk_create no envía post_save, así que no lo necesita. Las señales son
+    globales al proceso: los guardados de otros hilos durante el bloque
+    tampoco notifican a los observadores.
+    """
+    disconnect_rating_observers()
+    try:
+        yield
+    finally:
+        connect_rating_observers()
+
+
+connect_rating_observers()
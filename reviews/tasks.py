@@ -0,0 +1,75 @@
+"""
+Tareas en segundo plano del módulo reviews.
+
+El envío de emails se ejecuta en un pool de hilos una vez confirmada la
+transacción, de modo que la petición HTTP no espera la latencia SMTP.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.mail import send_mail
+from django.db import connections, transaction
+
+
+logger = logging.getLogger(__name__)
+
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='reviews-tasks')
+
+
+def notify_teacher_rating(rating_id):
+    """Envía email al profesor notificando la calificación con el ID dado"""
+    from .models import TeacherRating
+
+    try:
+        rating = TeacherRating.objects.select_related(
+            'teacher__user', 'student__user'
+        ).get(id=rating_id)
+        logger.debug("Intentando enviar email a: %s", rating.teacher.user.email)
+
+        subject = f"Nueva calificación recibida - {rating.rating}/5 estrellas"
+        message = f"""
+            Hola {rating.teacher.user.name},
+            
+            Has recibido una nueva calificación:
+            
+            Estudiante: {rating.student.user.name}
+            Calificación: {rating.rating}/5 estrellas
+            Comentario: {rating.comment or 'Sin comentario'}
+            Fecha: {rating.created_at.strftime('%d/%m/%Y %H:%M')}
+            
+            ¡Sigue brindando excelente educación!
+            
+            Saludos,
+            El equipo de NexClass
+            """
+
+        logger.debug(
+            "Preparando email - Asunto: %s, Para: %s, Desde: %s",
+            subject, rating.teacher.user.email, settings.DEFAULT_FROM_EMAIL
+        )
+
+        result = send_mail(
+            subject=subject,
+            message=message,
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            recipient_list=[rating.teacher.user.email],
+            fail_silently=False
+        )
+
+        if result == 1:
+            logger.debug("Email enviado exitosamente a %s", rating.teacher.user.email)
+        else:
+            logger.warning("Email no pudo ser enviado. Resultado: %s", result)
+
+    except Exception:
+        logger.exception("Error enviando email para rating ID %s", rating_id)
+    finally:
+        # Cada hilo del pool abre su propia conexión a la base de datos
+        connections.close_all()
+
+
+def enqueue_rating_notification(rating_id):
+    """Programa el email de la calificación para después del commit"""
+    transaction.on_commit(lambda: _executor.submit(notify_teacher_rating, rating_id))
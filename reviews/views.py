@@ -1,46 +1,25 @@
 from django.shortcuts import render, redirect, get_object_or_404
 from users.models import Teacher
 from .models import TeacherRating
+from .signals import RATING_OBSERVERS
 from .forms import TeacherRatingForm
 from django.contrib.auth.decorators import login_required
+from functools import lru_cache
+import logging
 
-@login_required
-def rate_teacher(request, teacher_id):
-    teacher = get_object_or_404(Teacher, id=teacher_id)
-    student = request.user.student  # Asumiendo que el usuario está autenticado como estudiante
-
-    # Intenta recuperar una calificación existente
-    try:
-        rating = TeacherRating.objects.get(teacher=teacher, student=student)
-        form = TeacherRatingForm(instance=rating)  # Prepara el formulario con la calificación existente
-    except TeacherRating.DoesNotExist:
-        rating = None
-        form = TeacherRatingForm()
+logger = logging.getLogger(__name__)
 
-    if request.method == 'POST':
-        form = TeacherRatingForm(request.POST, instance=rating)
-        if form.is_valid():
-            rating = form.save(commit=False)
-            rating.teacher = teacher
-            rating.student = student
-            
-            # Mostrar información del patrón Observer antes de guardar
-            observers_count = len(TeacherRating._observers)
-            observer_names = [obs.__class__.__name__ for obs in TeacherRating._observers]
-            
-            print(f"PATRÓN OBSERVER ACTIVADO:")
-            print(f"   Se notificará a {observers_count} observadores")
-            print(f"   Observadores: {', '.join(observer_names)}")
-            print(f"   Nueva calificación: {rating.rating}/5 para {teacher.user.name}")
-            
-            # Al guardar, automáticamente se ejecuta el patrón Observer
-            rating.save()  # Esto dispara notify_observers() automáticamente
-            
-            return redirect('teachers_detail', teacher_id=teacher.id)
 
-    # Información del patrón Observer para mostrar en el template
+@lru_cache(maxsize=1)
+def _observers_info():
+    """
+    Nombre y descripción de cada observador de TeacherRating.
+    
+    Los observadores son fijos (RATING_OBSERVERS en reviews/signals.py), así
+    que la lista se calcula una sola vez por proceso.
+    """
     observers_info = []
-    for obs in TeacherRating._observers:
+    for obs in RATING_OBSERVERS:
         description = 'Sin descripción'
         if obs.__doc__:
             lines = obs.__doc__.split('\n')
@@ -57,11 +36,49 @@ def rate_teacher(request, teacher_id):
             'name': obs.__class__.__name__,
             'description': description
         })
+    return tuple(observers_info)
+
+
+@login_required
+def rate_teacher(request, teacher_id):
+    teacher = get_object_or_404(Teacher.objects.select_related('user'), id=teacher_id)
+    student = request.user.student  # Asumiendo que el usuario está autenticado como estudiante
+
+    # Calificación existente del estudiante para este profesor (o None)
+    existing_rating = TeacherRating.objects.filter(teacher=teacher, student=student)
+
+    if request.method == 'POST':
+        rating = existing_rating.first()
+        form = TeacherRatingForm(request.POST, instance=rating)
+        if form.is_valid():
+            rating = form.save(commit=False)
+            rating.teacher = teacher
+            rating.student = student
+            
+            # Registrar información del patrón Observer antes de guardar
+            if logger.isEnabledFor(logging.DEBUG):
+                observer_names = [info['name'] for info in _observers_info()]
+                logger.debug(
+                    "Observer pattern: %d observers (%s), new rating %s/5 for %s",
+                    len(observer_names), ', '.join(observer_names), rating.rating, teacher.user.name
+                )
+            
+            # Al guardar, post_save notifica automáticamente a los observadores
+            rating.save()
+            
+            return redirect('teachers_detail', teacher_id=teacher.id)
+    else:
+        rating = existing_rating.select_related('teacher__user').first()
+        form = TeacherRatingForm(instance=rating)  # Prepara el formulario con la calificación existente
+
+    # GET o POST inválido: un único render con el formulario ya construido
+    # y la información memoizada del patrón Observer
+    observers_info = _observers_info()
     
     return render(request, 'rate_teacher.html', {
         'form': form, 
         'teacher': teacher,
-        'observers_count': len(TeacherRating._observers),
+        'observers_count': len(observers_info),
         'observers_info': observers_info,
         'pattern_demo': True
     })
@@ -7,12 +7,15 @@ como filtrado, búsqueda, paginación y mixins personalizados.
 
 from django.views.generic import ListView, TemplateView
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.db.models import Q, Count
+from django.db.models import Q, Count, Window
+from django.db.models.functions import TruncMonth
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
+from django.utils.functional import cached_property
 from datetime import timedelta
 from .models import BlogPost
 from .forms import BlogPostSearchForm
+from .stats import teachers_with_posts_choices, total_blog_posts, total_teachers_with_posts
 from users.models import Teacher
 
 
@@ -37,30 +40,27 @@ class BlogPostListView(ListView):
         # Búsqueda por texto
         search_query = self.request.GET.get('search_query')
         if search_query:
-            queryset = queryset.filter(
-                Q(title__icontains=search_query) | 
-                Q(content__icontains=search_query)
-            )
+            queryset = self.search(queryset, search_query)
         
-        return queryset.select_related('teacher__user')
+        return queryset.for_listing()
+    
+    def search(self, queryset, search_query):
+        """Filtra el queryset por texto (ver BlogPostQuerySet.search)."""
+        return queryset.search(search_query)
     
     def get_context_data(self, **kwargs):
         """Añade formulario de búsqueda y estadísticas al contexto."""
         context = super().get_context_data(**kwargs)
         
         # Formulario de búsqueda
-        teachers_with_posts = Teacher.objects.filter(
-            blog_posts__isnull=False
-        ).distinct()
-        
         context['search_form'] = BlogPostSearchForm(
             data=self.request.GET or None,
-            teachers_queryset=teachers_with_posts
+            teacher_choices=teachers_with_posts_choices()
         )
         
         # Estadísticas
-        context['total_posts'] = BlogPost.objects.count()
-        context['total_teachers'] = teachers_with_posts.count()
+        context['total_posts'] = total_blog_posts()
+        context['total_teachers'] = total_teachers_with_posts()
         
         return context
 
@@ -74,30 +74,30 @@ class BlogPostStatsView(LoginRequiredMixin, TemplateView):
         """Calcula y proporciona estadísticas detalladas."""
         context = super().get_context_data(**kwargs)
         
-        # Estadísticas generales
-        total_posts = BlogPost.objects.count()
-        total_teachers_with_posts = Teacher.objects.filter(
-            blog_posts__isnull=False
-        ).distinct().count()
-        
-        # Posts recientes (última semana)
+        # Total de posts y posts de la última semana en una sola consulta
         last_week = timezone.now() - timedelta(days=7)
-        recent_posts = BlogPost.objects.filter(created_at__gte=last_week).count()
+        post_counts = BlogPost.objects.aggregate(
+            total=Count('id'),
+            recent=Count('id', filter=Q(created_at__gte=last_week))
+        )
+        teachers_count = total_teachers_with_posts()
         
         # Teachers más activos
-        top_teachers = Teacher.objects.annotate(
-            post_count=Count('blog_posts')
+        top_teachers = Teacher.objects.select_related('user').annotate(
+            post_count=Count('blog_posts', distinct=True)
         ).filter(post_count__gt=0).order_by('-post_count')[:5]
         
         # Posts más recientes
         latest_posts = BlogPost.objects.select_related(
             'teacher__user'
+        ).only(
+            'id', 'title', 'created_at', 'teacher__user__name'
         ).order_by('-created_at')[:10]
         
         context.update({
-            'total_posts': total_posts,
-            'total_teachers_with_posts': total_teachers_with_posts,
-            'recent_posts_count': recent_posts,
+            'total_posts': post_counts['total'],
+            'total_teachers_with_posts': teachers_count,
+            'recent_posts_count': post_counts['recent'],
             'top_teachers': top_teachers,
             'latest_posts': latest_posts,
             'stats_generated_at': timezone.now(),
@@ -114,32 +114,35 @@ class MyBlogPostsView(LoginRequiredMixin, ListView):
     context_object_name = 'my_posts'
     paginate_by = 5
     
+    @cached_property
+    def my_posts(self):
+        """Posts del teacher autenticado, evaluados una sola vez por petición."""
+        if not self.request.teacher:
+            return []
+        return list(
+            BlogPost.objects.for_listing().filter(
+                teacher=self.request.teacher
+            ).order_by('-created_at')
+        )
+    
     def get_queryset(self):
-        """Filtra solo los posts del teacher autenticado."""
-        if not hasattr(self.request.user, 'teacher'):
-            return BlogPost.objects.none()
-        
-        return BlogPost.objects.filter(
-            teacher=self.request.user.teacher
-        ).order_by('-created_at')
+        """Filtra solo los posts del teacher autenticado (la paginación usa la lista ya cargada)."""
+        return self.my_posts
     
     def get_context_data(self, **kwargs):
         """Añade estadísticas personales del teacher."""
         context = super().get_context_data(**kwargs)
         
-        if hasattr(self.request.user, 'teacher'):
-            teacher = self.request.user.teacher
+        if self.request.teacher:
+            teacher = self.request.teacher
             
-            # Estadísticas personales
-            total_posts = self.get_queryset().count()
-            this_month = timezone.now().replace(day=1)
-            posts_this_month = self.get_queryset().filter(
-                created_at__gte=this_month
-            ).count()
+            # Estadísticas personales sobre los posts ya cargados, sin más consultas
+            this_month = timezone.now().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+            posts = self.my_posts
             
             context.update({
-                'total_my_posts': total_posts,
-                'posts_this_month': posts_this_month,
+                'total_my_posts': len(posts),
+                'posts_this_month': sum(1 for post in posts if post.created_at >= this_month),
                 'teacher': teacher,
             })
         
@@ -154,26 +157,22 @@ class BlogPostArchiveView(ListView):
     context_object_name = 'posts_by_month'
     
     def get_queryset(self):
-        """Organiza posts por mes y año."""
-        return BlogPost.objects.extra(
-            select={
-                'month': "DATE_FORMAT(created_at, '%%Y-%%m')",
-                'year': "DATE_FORMAT(created_at, '%%Y')",
-            }
-        ).values('month', 'year').annotate(
+        """Organiza posts por mes (TruncMonth funciona en cualquier motor de base de datos)."""
+        return BlogPost.objects.annotate(
+            month=TruncMonth('created_at')
+        ).values('month').annotate(
             post_count=Count('id')
-        ).order_by('-year', '-month')
+        ).order_by('-month')
     
     def get_context_data(self, **kwargs):
         """Añade información adicional sobre el archivo."""
         context = super().get_context_data(**kwargs)
         
-        # Obtener años únicos para navegación
-        years = BlogPost.objects.extra(
-            select={'year': "DATE_FORMAT(created_at, '%%Y')"}
-        ).values('year').distinct().order_by('-year')
-        
-        context['years'] = [item['year'] for item in years]
+        # Años únicos para navegación, derivados de los meses ya consultados
+        context['years'] = sorted(
+            {item['month'].year for item in context['object_list']},
+            reverse=True
+        )
         
         return context
 
@@ -188,11 +187,15 @@ class BlogPostContextMixin:
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         
-        # Añadir información común
-        context['total_blog_posts'] = BlogPost.objects.count()
-        context['recent_posts'] = BlogPost.objects.select_related(
-            'teacher__user'
-        ).order_by('-created_at')[:3]
+        # Posts recientes y total de posts en una sola consulta:
+        # COUNT(*) OVER () se calcula antes del LIMIT
+        recent_posts = list(
+            BlogPost.objects.for_listing().annotate(
+                total=Window(expression=Count('id'))
+            ).order_by('-created_at')[:3]
+        )
+        context['total_blog_posts'] = recent_posts[0].total if recent_posts else 0
+        context['recent_posts'] = recent_posts
         
         return context
 
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class TeacherBlogConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'teacher_blog'
+
+    def ready(self):
+        from . import signals  # noqa: F401
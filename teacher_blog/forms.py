@@ -59,16 +59,14 @@ class BlogPostSearchForm(forms.Form):
         label='Buscar'
     )
     
-    teacher = forms.ModelChoiceField(
-        queryset=None,  # Se define en la vista
+    teacher = forms.ChoiceField(
+        choices=(),  # Se define en la vista
         required=False,
-        empty_label="Todos los profesores",
         widget=forms.Select(attrs={'class': 'form-control'}),
         label='Profesor'
     )
     
     def __init__(self, *args, **kwargs):
-        teachers_queryset = kwargs.pop('teachers_queryset', None)
+        teacher_choices = kwargs.pop('teacher_choices', ())
         super().__init__(*args, **kwargs)
-        if teachers_queryset:
-            self.fields['teacher'].queryset = teachers_queryset
+        self.fields['teacher'].choices = [('', 'Todos los profesores'), *teacher_choices]
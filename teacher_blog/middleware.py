@@ -0,0 +1,32 @@
+"""
+Middleware del módulo teacher_blog.
+
+Resuelve bajo demanda, y como mucho una vez por petición, el Teacher del
+usuario autenticado.
+"""
+
+from django.utils.functional import SimpleLazyObject
+
+
+def _get_teacher(request):
+    if not request.user.is_authenticated:
+        return None
+    # Django deja el Teacher cacheado en request.user
+    return getattr(request.user, 'teacher', None)
+
+
+class UserTeacherMiddleware:
+    """
+    Expone en request.teacher el Teacher del usuario.
+    
+    Es un objeto perezoso: la consulta solo se hace si una vista lo lee. Para
+    saber si el usuario es teacher hay que evaluar su valor de verdad
+    (`if request.teacher:`), no compararlo con `is None`.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.teacher = SimpleLazyObject(lambda: _get_teacher(request))
+        return self.get_response(request)
@@ -0,0 +1,47 @@
+# Generated by Django 5.1 on 2026-10-15 10:00
+
+from django.db import migrations
+
+
+# Columna generada con el vector de texto completo de título y contenido,
+# indexada con GIN. Solo existe en PostgreSQL; la consulta que la usa está
+# en BlogPostQuerySet.search y la configuración debe coincidir con
+# BLOG_SEARCH_CONFIG.
+ADD_SEARCH_VECTOR_SQL = [
+    """
+    ALTER TABLE teacher_blog_blogpost
+    ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+        setweight(to_tsvector('spanish', coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('spanish', coalesce(content, '')), 'B')
+    ) STORED
+    """,
+    "CREATE INDEX blogpost_search_vector_gin ON teacher_blog_blogpost USING GIN (search_vector)",
+]
+
+REMOVE_SEARCH_VECTOR_SQL = [
+    "DROP INDEX IF EXISTS blogpost_search_vector_gin",
+    "ALTER TABLE teacher_blog_blogpost DROP COLUMN IF EXISTS search_vector",
+]
+
+
+def _run_on_postgresql(statements):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != 'postgresql':
+            return
+        for statement in statements:
+            schema_editor.execute(statement)
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('teacher_blog', '0002_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            _run_on_postgresql(ADD_SEARCH_VECTOR_SQL),
+            _run_on_postgresql(REMOVE_SEARCH_VECTOR_SQL),
+        ),
+    ]
@@ -1,7 +1,52 @@
 # teacher_blog/models.py
-from django.db import models
+from django.db import connections, models
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Substr
 from users.models import Teacher
 
+# Caracteres de contenido que se cargan como resumen en los listados
+BLOG_POST_EXCERPT_LENGTH = 1000
+
+# Configuración de texto completo de la columna search_vector (solo PostgreSQL,
+# la crea la migración 0003_blogpost_search_vector)
+BLOG_SEARCH_CONFIG = 'spanish'
+
+
+class BlogPostQuerySet(models.QuerySet):
+    def for_listing(self):
+        """
+        Posts para listados: difiere `content` y trae solo un resumen.
+        
+        Los templates de listados deben usar `post.excerpt`; acceder a
+        `post.content` dispararía una consulta por post.
+        """
+        return self.select_related('teacher__user').defer('content').annotate(
+            excerpt=Substr('content', 1, BLOG_POST_EXCERPT_LENGTH)
+        )
+    
+    def search(self, text):
+        """
+        Filtra por texto en título y contenido.
+        
+        En PostgreSQL usa la columna indexada search_vector (GIN) y ordena por
+        relevancia; en otros motores (SQLite en desarrollo) recurre a icontains.
+        """
+        connection = connections[self.db]
+        if connection.vendor != 'postgresql':
+            return self.filter(
+                models.Q(title__icontains=text) | models.Q(content__icontains=text)
+            )
+        
+        column = f'{connection.ops.quote_name(self.model._meta.db_table)}.search_vector'
+        tsquery = 'websearch_to_tsquery(%s, %s)'
+        params = (BLOG_SEARCH_CONFIG, text)
+        return self.filter(
+            RawSQL(f'{column} @@ {tsquery}', params, output_field=models.BooleanField())
+        ).annotate(
+            rank=RawSQL(f'ts_rank({column}, {tsquery})', params, output_field=models.FloatField())
+        ).order_by('-rank', '-created_at')
+
+
 class BlogPost(models.Model):
     teacher = models.ForeignKey(Teacher, on_delete=models.CASCADE, related_name='blog_posts')
     title = models.CharField(max_length=200)
@@ -10,5 +55,7 @@ class BlogPost(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = BlogPostQuerySet.as_manager()
+
     def __str__(self):
         return self.title
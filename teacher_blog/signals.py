@@ -0,0 +1,20 @@
+"""
+Señales del módulo teacher_blog.
+
+Invalidan los conteos cacheados del blog cuando se crea o elimina un post.
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .models import BlogPost
+from .stats import clear_blog_stats_cache
+
+
+@receiver(post_save, sender=BlogPost)
+@receiver(post_delete, sender=BlogPost)
+def invalidate_blog_stats(sender, instance, created=True, **kwargs):
+    """Elimina de la caché los conteos globales del blog."""
+    # Editar un post existente no cambia los conteos
+    if created:
+        clear_blog_stats_cache()
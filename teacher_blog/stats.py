@@ -0,0 +1,59 @@
+"""
+Consultas de estadísticas del blog reutilizadas por varias vistas.
+
+Los conteos globales se guardan en caché por poco tiempo; las señales de
+BlogPost (ver signals.py) los invalidan cuando se crea o elimina un post.
+"""
+
+from django.core.cache import cache
+from django.db.models import Exists, OuterRef
+
+from .models import BlogPost
+from users.models import Teacher
+
+
+BLOG_STATS_CACHE_TIMEOUT = 60
+TOTAL_POSTS_CACHE_KEY = 'blogpost_total'
+TOTAL_TEACHERS_CACHE_KEY = 'blogpost_total_teachers_with_posts'
+TEACHER_CHOICES_CACHE_KEY = 'blogpost_teachers_with_posts_choices'
+TEACHER_CHOICES_CACHE_TIMEOUT = 300
+
+
+def teachers_with_blog_posts():
+    """Teachers con al menos un post, filtrados con EXISTS en lugar de JOIN + DISTINCT."""
+    return Teacher.objects.filter(
+        Exists(BlogPost.objects.filter(teacher=OuterRef('pk')))
+    )
+
+
+def total_blog_posts():
+    """Número total de posts, cacheado por BLOG_STATS_CACHE_TIMEOUT segundos."""
+    return cache.get_or_set(
+        TOTAL_POSTS_CACHE_KEY, BlogPost.objects.count, BLOG_STATS_CACHE_TIMEOUT
+    )
+
+
+def total_teachers_with_posts():
+    """Número de teachers con posts, cacheado por BLOG_STATS_CACHE_TIMEOUT segundos."""
+    return cache.get_or_set(
+        TOTAL_TEACHERS_CACHE_KEY,
+        lambda: teachers_with_blog_posts().count(),
+        BLOG_STATS_CACHE_TIMEOUT
+    )
+
+
+def teachers_with_posts_choices():
+    """Pares (id, nombre) de los teachers con posts para el filtro de búsqueda."""
+    return cache.get_or_set(
+        TEACHER_CHOICES_CACHE_KEY,
+        lambda: list(
+            teachers_with_blog_posts().order_by('user__name').values_list('id', 'user__name')
+        ),
+        TEACHER_CHOICES_CACHE_TIMEOUT
+    )
+
+
+def clear_blog_stats_cache():
+    cache.delete_many([
+        TOTAL_POSTS_CACHE_KEY, TOTAL_TEACHERS_CACHE_KEY, TEACHER_CHOICES_CACHE_KEY
+    ])
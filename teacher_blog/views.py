@@ -1,11 +1,12 @@
 # teacher_blog/views.py - REFACTORIZADO CON CLASS-BASED VIEWS
 from django.shortcuts import render, redirect, get_object_or_404
-from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
 from django.views.generic import (
     CreateView, UpdateView, DeleteView, DetailView, ListView
 )
 from django.urls import reverse_lazy
+from django.http import Http404
+from django.utils.functional import cached_property
 from django.contrib import messages
 from django.contrib.messages.views import SuccessMessageMixin
 from .models import BlogPost
@@ -20,22 +21,47 @@ from users.models import Teacher
 class TeacherRequiredMixin(UserPassesTestMixin):
     """Mixin que requiere que el usuario sea un teacher."""
     
-    def test_func(self):
+    @cached_property
+    def _is_teacher(self):
         return (hasattr(self.request.user, 'user_type') and 
                 self.request.user.user_type == 'Teacher')
     
+    def test_func(self):
+        return self._is_teacher
+    
     def handle_no_permission(self):
         return redirect('home')
+    
+    @cached_property
+    def current_teacher(self):
+        """Teacher del usuario autenticado (resuelto por UserTeacherMiddleware)."""
+        if not self.request.teacher:
+            raise Http404("No Teacher matches the given query.")
+        return self.request.teacher
 
 
 class BlogPostOwnerMixin(UserPassesTestMixin):
     """Mixin que verifica que el usuario sea el propietario del blog post."""
     
-    def test_func(self):
-        if not hasattr(self.request.user, 'teacher'):
+    @cached_property
+    def _is_owner(self):
+        if not self.request.teacher:
             return False
-        blog_post = self.get_object()
-        return blog_post.teacher == self.request.user.teacher
+        # Compara el id del FK para no cargar el teacher del post
+        return self.get_object().teacher_id == self.request.teacher.id
+    
+    def test_func(self):
+        return self._is_owner
+    
+    def get_object(self, queryset=None):
+        """Obtiene el post una sola vez por petición (test_func y la vista lo reutilizan)."""
+        if not hasattr(self, '_object'):
+            if queryset is None:
+                queryset = self.get_queryset()
+            self._object = super().get_object(
+                queryset=queryset.select_related('teacher__user')
+            )
+        return self._object
 
 
 # ================================================================
@@ -54,8 +80,7 @@ class BlogPostCreateView(LoginRequiredMixin, TeacherRequiredMixin,
     
     def form_valid(self, form):
         """Asigna automáticamente el teacher al blog post."""
-        teacher = get_object_or_404(Teacher, user=self.request.user)
-        form.instance.teacher = teacher
+        form.instance.teacher = self.current_teacher
         return super().form_valid(form)
     
     def get_context_data(self, **kwargs):
@@ -104,6 +129,10 @@ class BlogPostDetailView(DetailView):
     template_name = 'teacher_blog/view_blog_post.html'
     context_object_name = 'post'
     pk_url_kwarg = 'post_id'
+    
+    def get_queryset(self):
+        """Trae el teacher y su usuario en la misma consulta del post."""
+        return super().get_queryset().select_related('teacher__user')
 
 
 class TeacherBlogPostListView(ListView):
@@ -116,8 +145,12 @@ class TeacherBlogPostListView(ListView):
     
     def get_queryset(self):
         """Filtra los blog posts por teacher."""
-        self.teacher = get_object_or_404(Teacher, id=self.kwargs['teacher_id'])
-        return BlogPost.objects.filter(teacher=self.teacher).order_by('-created_at')
+        self.teacher = get_object_or_404(
+            Teacher.objects.select_related('user'), id=self.kwargs['teacher_id']
+        )
+        return super().get_queryset().for_listing().filter(
+            teacher=self.teacher
+        ).order_by('-created_at')
     
     def get_context_data(self, **kwargs):
         """Añade el teacher al contexto."""
@@ -127,32 +160,13 @@ class TeacherBlogPostListView(ListView):
 
 
 # ================================================================
-# VISTAS BASADAS EN FUNCIONES (MANTENIDAS PARA COMPATIBILIDAD)
+# NOMBRES DE VISTAS (MANTENIDOS PARA COMPATIBILIDAD CON urls.py)
 # ================================================================
-
-@login_required
-def create_blog_post(request):
-    """Vista legacy - redirige a la nueva CBV."""
-    return BlogPostCreateView.as_view()(request)
-
-
-@login_required
-def edit_blog_post(request, pk):
-    """Vista legacy - redirige a la nueva CBV."""
-    return BlogPostUpdateView.as_view()(request, pk=pk)
-
-
-@login_required
-def delete_blog_post(request, pk):
-    """Vista legacy - redirige a la nueva CBV."""
-    return BlogPostDeleteView.as_view()(request, pk=pk)
-
-
-def teacher_blog_posts(request, teacher_id):
-    """Vista legacy - redirige a la nueva CBV."""
-    return TeacherBlogPostListView.as_view()(request, teacher_id=teacher_id)
-
-
-def view_blog_post(request, post_id):
-    """Vista legacy - redirige a la nueva CBV."""
-    return BlogPostDetailView.as_view()(request, post_id=post_id)
\ No newline at end of file
+# as_view() se llama una sola vez al importar el módulo. La autenticación
+# la aplica LoginRequiredMixin en cada CBV, así que no se usa @login_required.
+
+create_blog_post = BlogPostCreateView.as_view()
+edit_blog_post = BlogPostUpdateView.as_view()
+delete_blog_post = BlogPostDeleteView.as_view()
+teacher_blog_posts = TeacherBlogPostListView.as_view()
+view_blog_post = BlogPostDetailView.as_view()
@@ -1,16 +1,16 @@
 from django.core.management.base import BaseCommand
 from users.models import Teacher
-from embeddings_simmilarities.utils import generate_embedding
+from embeddings_simmilarities.utils import generate_embeddings
 
 
 class Command(BaseCommand):
     help = 'Update embeddings for all existing teachers'
 
     def handle(self, *args, **kwargs):
-        teachers = Teacher.objects.all()
+        teachers = list(Teacher.objects.all())
 
-        for teacher in teachers:
-            combined_text = (
+        combined_texts = [
+            (
                 f"Description: {teacher.description}. "
                 f"Specialities: {teacher.specialities}. "
                 f"Biography: {teacher.biography}. "
@@ -19,9 +19,13 @@ class Command(BaseCommand):
                 f"Availability: {teacher.availability}. "
                 f"Average rating: {teacher.average_rating}."
             )
+            for teacher in teachers
+        ]
 
-            embedding = generate_embedding(combined_text)
-            teacher.set_embedding(embedding)
+        embeddings = generate_embeddings(combined_texts)
+
+        for teacher, embedding in zip(teachers, embeddings):
+            teacher.set_embedding(embedding.tolist())
             teacher.save()
 
         self.stdout.write(self.style.SUCCESS('Embeddings have been updated successfully.'))
@@ -1,9 +1,11 @@
 from django.db import models
+from django.db.models import Avg
 
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager
 from django.contrib.auth.models import PermissionsMixin
-import pickle
-from embeddings_simmilarities.utils import generate_embedding, save_embedding_to_binary
+from embeddings_simmilarities.utils import (
+    generate_embedding, save_embedding_to_binary, load_embedding_from_binary, is_legacy_embedding_binary
+)
 
 
 # Create your models here.
@@ -111,16 +113,18 @@ class Teacher(models.Model):
     ciudad = models.CharField(max_length=150, default="Colombia")
 
     def average_rating(self):
-        ratings = self.ratings.all()
-        if ratings:
-            return sum([rating.rating for rating in ratings]) / ratings.count()
-        return 0
+        return self.ratings.aggregate(avg=Avg('rating'))['avg'] or 0
 
     def set_embedding(self, emb_vector):
         self.embedding = save_embedding_to_binary(emb_vector)
 
     def get_embedding(self):
-        return pickle.loads(self.embedding)
+        embedding = load_embedding_from_binary(self.embedding)
+        if is_legacy_embedding_binary(self.embedding):
+            # Migración perezosa de blobs pickle al formato float32
+            self.set_embedding(embedding)
+            type(self).objects.filter(pk=self.pk).update(embedding=self.embedding)
+        return embedding
 
     def save(self, *args, **kwargs):
         # Combinación de los textos relevantes para generar el embedding
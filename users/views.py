@@ -18,7 +18,7 @@ from dotenv import load_dotenv, find_dotenv
 from openai import OpenAI
 import os
 from classCreation_Schedules.models import Class
-from embeddings_simmilarities.utils import calcular_similitud
+from embeddings_simmilarities.index import most_similar
 from django.db.models import Count
 import json
 
@@ -76,23 +76,11 @@ def home(request):
                 )
                 user_embedding = response.data[0].embedding
 
-                clases = Class.objects.all()
-
-                teachers = Teacher.objects.all()
-
-                resultado_teacher = []
-                resultado_clases = []
-
-                for clase in clases:
-                    similitud = calcular_similitud(user_embedding, clase.get_embedding())
-                    resultado_clases.append((clase, similitud))
-
-                for teacher in teachers:
-                    similitud = calcular_similitud(user_embedding, teacher.get_embedding())
-                    resultado_teacher.append((teacher, similitud))
-
-                resultado_clases_sorted = sorted(resultado_clases, key=lambda x: x[1], reverse=True)[:3]
-                resultado_teacher_sorted = sorted(resultado_teacher, key=lambda x: x[1], reverse=True)[:3]
+                # Búsqueda top-k sobre el índice de embeddings de cada modelo
+                resultado_clases_sorted = most_similar(Class, user_embedding, 3)
+                resultado_teacher_sorted = most_similar(
+                    Teacher, user_embedding, 3, queryset=Teacher.objects.select_related('user')
+                )
                 bot_text += "\nTe recomendaría estas opciones basadas en tu mensaje:\n"
                 bot_text += "clases: "
                 for class_obj, sim in resultado_clases_sorted: